@@ -28,18 +28,17 @@ def _simulation_output(
         var_names[i]: float(var_array[i]) for i in range(len(var_names))
     }
 
-    # Create ParameterType dictionary to write calibration.cal file
-    params_sim = []
-    for i, param in enumerate(params_bounds):
-        params_sim.append(
-            {
-                'name': param.name,
-                'change_type': param.change_type,
-                'value': var_dict[var_names[i]],
-                'units': param.units,
-                'conditions': param.conditions
-            }
+    # Create ModifyDict objects from the validated bounds to write calibration.cal file
+    params_sim = [
+        newtype.ModifyDict(
+            name=param.name,
+            change_type=param.change_type,
+            value=var_dict[var_names[i]],
+            units=param.units,
+            conditions=param.conditions
         )
+        for i, param in enumerate(params_bounds)
+    ]
 
     # Display start of current simulation for tracking
     print(
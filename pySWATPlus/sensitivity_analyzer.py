@@ -80,8 +80,8 @@ class SensitivityAnalyzer:
         # Path to the JOSN file
         json_file = sensim_dir / 'sensitivity_simulation.json'
 
-        # Write output to the JSON file
-        with open(json_file, 'w') as output_write:
+        # Write output to the JSON file; large buffer groups the many small chunks from json.dump
+        with open(json_file, 'w', buffering=1024 * 1024) as output_write:
             json.dump(copy_simulation, output_write, indent=4)
 
         return None
@@ -1,5 +1,9 @@
 import subprocess
-import shutil
+import concurrent.futures
+import mmap
+import os
+import re
+import threading
 import pathlib
 import typing
 import logging
@@ -9,6 +13,12 @@ from . import validators
 
 logger = logging.getLogger(__name__)
 
+# Simulation output files that are not copied to a simulation directory
+_IGNORED_FILES_RE = re.compile(r'_(?:day|mon|yr|aa)\.(?:txt|csv)\Z')
+
+# Threads copying files to a simulation directory, kept small because copies run inside parallel simulation processes
+_COPY_MAX_WORKERS = 4
+
 
 class TxtinoutReader:
     '''
@@ -53,11 +63,55 @@ class TxtinoutReader:
                 'Expected exactly one executable file in the parent folder, but found none or multiple'
             )
 
+        # Set directory and executable paths
+        self._set_paths(
+            tio_dir=tio_dir,
+            exe_name=exe_files[0].name
+        )
+
+    def _set_paths(
+        self,
+        tio_dir: pathlib.Path,
+        exe_name: str
+    ) -> None:
+        '''
+        Set the `TxtInOut` directory and executable file paths of the instance.
+        '''
+
         # TxtInOut directory path
         self.root_dir = tio_dir
 
         # EXE file path
-        self.exe_file = tio_dir / exe_files[0]
+        self.exe_file = tio_dir / exe_name
+
+        # String paths used to launch the simulation
+        self._root_dir_str = str(self.root_dir)
+        self._exe_file_str = str(self.exe_file)
+
+        # String paths of frequently modified input files
+        self._print_prt_file = str(tio_dir / 'print.prt')
+        self._time_sim_file = str(tio_dir / 'time.sim')
+
+        return None
+
+    @classmethod
+    def _from_copied_dir(
+        cls,
+        tio_dir: pathlib.Path,
+        exe_name: str
+    ) -> 'TxtinoutReader':
+        '''
+        Create a TxtinoutReader instance for a resolved directory populated by `copy_required_files`,
+        skipping the directory validation and executable scan already done for the source directory.
+        '''
+
+        reader = cls.__new__(cls)
+        reader._set_paths(
+            tio_dir=tio_dir,
+            exe_name=exe_name
+        )
+
+        return reader
 
     def enable_object_in_print_prt(
         self,
@@ -98,86 +152,88 @@ class TxtinoutReader:
             vars_values=locals()
         )
 
-        # Dictionary of available objects
-        obj_dict = {
-            'model_components': ['channel', 'channel_sd', 'channel_sdmorph', 'aquifer', 'reservoir', 'recall', 'ru', 'hyd', 'water_allo'],
-            'basin_model_components': ['basin_cha', 'basin_sd_cha', 'basin_sd_chamorph', 'basin_aqu', 'basin_res', 'basin_psc'],
-            'region_model_components': ['region_sd_cha', 'region_aqu', 'region_res', 'region_psc'],
-            'nutrient_balance': ['basin_nb', 'lsunit_nb', 'hru_nb', 'hru-lte_nb', 'region_nb'],
-            'water_balance': ['basin_wb', 'lsunit_wb', 'hru_wb', 'hru-lte_wb', 'region_wb'],
-            'plant_weather': ['basin_pw', 'lsunit_pw', 'hru_pw', 'hru-lte_pw', 'region_pw'],
-            'losses': ['basin_ls', 'lsunit_ls', 'hru_ls', 'hru-lte_ls', 'region_ls'],
-            'salts': ['basin_salt', 'hru_salt', 'ru_salt', 'aqu_salt', 'channel_salt', 'res_salt', 'wetland_salt'],
-            'constituents': ['basin_cs', 'hru_cs', 'ru_cs', 'aqu_cs', 'channel_cs', 'res_cs', 'wetland_cs']
-        }
+        # Check 'obj' is valid
+        if obj:
+            validators._print_prt_object(
+                obj=obj,
+                allow_unavailable_object=allow_unavailable_object
+            )
 
-        # List of objects obtained from the dictionary
-        obj_list = [
-            i for v in obj_dict.values() for i in v
-        ]
+        # Time frequency settings
+        flags = {
+            'daily': daily,
+            'monthly': monthly,
+            'yearly': yearly,
+            'avann': avann
+        }
 
-        # Check 'obj' is valid
-        if obj and obj not in obj_list and not allow_unavailable_object:
-            raise ValueError(
-                f'Object "{obj}" not found in print.prt file; use "allow_unavailable_object=True" to proceed'
+        # Update print.prt file
+        if obj is None:
+            self._update_print_prt_objects(
+                obj_flags={},
+                all_flags=flags
+            )
+        else:
+            self._update_print_prt_objects(
+                obj_flags={obj: flags}
             )
 
+        return None
+
+    def _update_print_prt_objects(
+        self,
+        obj_flags: dict[str, dict[str, bool]],
+        all_flags: typing.Optional[dict[str, bool]] = None
+    ) -> None:
+        '''
+        Update time frequency settings of multiple objects in the `print.prt` file in a single read and write pass.
+        Objects in `obj_flags` that do not exist in the file are appended to the end of the file. If `all_flags`
+        is provided, it is applied to every other object already in the file.
+        '''
+
         # File path of print.prt
-        print_prt_path = self.root_dir / 'print.prt'
-
-        # Read and modify print.prt file strings
-        new_print_prt = ''
-        found = False
-        with open(print_prt_path, 'r', newline='') as file:
-            for i, line in enumerate(file, start=1):
-                if i <= 10:
-                    # Always keep first 10 lines as-is
-                    new_print_prt += line
-                    continue
-
-                stripped = line.strip()
-                if not stripped:
-                    # Keep blank lines unchanged
-                    new_print_prt += line
-                    continue
-
-                parts = stripped.split()
-                line_obj = parts[0]
-
-                if obj is None:
-                    # Update all objects
-                    new_print_prt += utils._print_prt_line_add(
-                        obj=line_obj,
-                        daily=daily,
-                        monthly=monthly,
-                        yearly=yearly,
-                        avann=avann
-                    )
-                elif line_obj == obj:
-                    # Already 'obj' exist, replace it in same position
-                    new_print_prt += utils._print_prt_line_add(
-                        obj=line_obj,
-                        daily=daily,
-                        monthly=monthly,
-                        yearly=yearly,
-                        avann=avann
-                    )
-                    found = True
-                else:
-                    new_print_prt += line
+        print_prt_path = self._print_prt_file
 
-        if not found and obj is not None:
-            new_print_prt += utils._print_prt_line_add(
-                obj=obj,
-                daily=daily,
-                monthly=monthly,
-                yearly=yearly,
-                avann=avann
-            )
+        # Encoded object names and their lines, computed once outside the loop
+        obj_lines = {
+            key.encode(): utils._print_prt_line_add(obj=key, **val).encode() for key, val in obj_flags.items()
+        }
+
+        # Read print.prt file lines
+        with open(print_prt_path, 'rb') as file:
+            lines = file.readlines()
+
+        # Modify object lines; first 10 lines and blank lines are always kept as-is
+        found = set()
+        for i in range(10, len(lines)):
+            parts = lines[i].split(None, 1)
+            if not parts:
+                continue
+
+            line_obj = parts[0]
+            if line_obj in obj_lines:
+                # Already object exist, replace it in same position
+                lines[i] = obj_lines[line_obj]
+                found.add(line_obj)
+                if all_flags is None and len(found) == len(obj_lines):
+                    break
+            elif all_flags is not None:
+                # Update all other objects
+                lines[i] = utils._print_prt_line_add(
+                    obj=line_obj.decode(),
+                    **all_flags
+                ).encode()
+
+        # Append objects not found in the file
+        lines.extend(
+            val for key, val in obj_lines.items() if key not in found
+        )
 
         # Store modified print.prt file
-        with open(print_prt_path, 'w', newline='') as file:
-            file.write(new_print_prt)
+        utils._file_write_bytes(
+            file_path=print_prt_path,
+            data=b''.join(lines)
+        )
 
         return None
 
@@ -223,32 +279,12 @@ class TxtinoutReader:
         end_day = end_dt.timetuple().tm_yday
         end_year = end_dt.year
 
-        # Target line
-        nth_line = 3
-
-        # File path of time.sim
-        time_sim_path = self.root_dir / 'time.sim'
-
-        # Open the file in read mode and read its contents
-        with open(time_sim_path, 'r') as file:
-            lines = file.readlines()
-
-        # Split targeted line
-        elements = lines[nth_line - 1].split()
-
-        # Update values
-        elements[0] = str(begin_day)
-        elements[1] = str(begin_year)
-        elements[2] = str(end_day)
-        elements[3] = str(end_year)
-
-        # Reconstruct the result string while maintaining spaces
-        result_string = '{: >8} {: >10} {: >10} {: >10} {: >10} \n'.format(*elements)
-        lines[nth_line - 1] = result_string
-
-        # Modify time.sim file
-        with open(time_sim_path, 'w') as file:
-            file.writelines(lines)
+        # Modify the targeted line of time.sim file while maintaining spaces
+        utils._file_line_update(
+            file_path=self._time_sim_file,
+            nth_line=3,
+            line_update=lambda elements: f'{begin_day: >8} {begin_year: >10} {end_day: >10} {end_year: >10} {elements[4]: >10} '
+        )
 
         return None
 
@@ -292,29 +328,12 @@ class TxtinoutReader:
                 f'Received invalid step: {step}; must be one of the keys in {valid_steps}'
             )
 
-        # Target line
-        nth_line = 3
-
-        # File path of time.sim
-        time_sim_path = self.root_dir / 'time.sim'
-
-        # Open the file in read mode and read its contents
-        with open(time_sim_path, 'r') as file:
-            lines = file.readlines()
-
-        # Split targeted line
-        elements = lines[nth_line - 1].split()
-
-        # Update values
-        elements[4] = str(step)
-
-        # Reconstruct the result string while maintaining spaces
-        result_string = '{: >8} {: >10} {: >10} {: >10} {: >10} \n'.format(*elements)
-        lines[nth_line - 1] = result_string
-
-        # Modify time.sim file
-        with open(time_sim_path, 'w') as file:
-            file.writelines(lines)
+        # Modify the targeted line of time.sim file while maintaining spaces
+        utils._file_line_update(
+            file_path=self._time_sim_file,
+            nth_line=3,
+            line_update=lambda elements: f'{elements[0]: >8} {elements[1]: >10} {elements[2]: >10} {elements[3]: >10} {step: >10} '
+        )
 
         return None
 
@@ -343,30 +362,12 @@ class TxtinoutReader:
                 f'Expected warmup >= 1, but received warmup = {warmup}'
             )
 
-        # File path of print.prt
-        print_prt_path = self.root_dir / 'print.prt'
-
-        # Open the file in read mode and read its contents
-        with open(print_prt_path, 'r') as file:
-            lines = file.readlines()
-
-        # Target line
-        nth_line = 3
-        year_line = lines[nth_line - 1]
-
-        # Split the input string by spaces
-        elements = year_line.split()
-
-        # Modify warmup year
-        elements[0] = str(warmup)
-
-        # Reconstruct the result string while maintaining spaces
-        result_string = '{: <12} {: <11} {: <11} {: <10} {: <10} {: <10} \n'.format(*elements)
-
-        lines[nth_line - 1] = result_string
-
-        with open(print_prt_path, 'w') as file:
-            file.writelines(lines)
+        # Modify the targeted line of print.prt file while maintaining spaces
+        utils._file_line_update(
+            file_path=self._print_prt_file,
+            nth_line=3,
+            line_update=lambda elements: f'{warmup: <12} {elements[1]: <11} {elements[2]: <11} {elements[3]: <10} {elements[4]: <10} {elements[5]: <10} '
+        )
 
         return None
 
@@ -379,24 +380,24 @@ class TxtinoutReader:
         '''
 
         # File path of print.prt
-        print_prt_path = self.root_dir / 'print.prt'
+        print_prt_path = self._print_prt_file
 
         # Target line
         nth_line = 7
 
-        # Open the file in read mode and read its contents
-        with open(print_prt_path, 'r') as file:
-            lines = file.readlines()
-
-        # Change line string
-        if enable:
-            lines[nth_line - 1] = 'y' + lines[nth_line - 1][1:]
-        else:
-            lines[nth_line - 1] = 'n' + lines[nth_line - 1][1:]
+        # Required flag character
+        flag = ord('y' if enable else 'n')
 
-        # Modify print.prt file
-        with open(print_prt_path, 'w') as file:
-            file.writelines(lines)
+        # Overwrite the first character of the target line in place, unless already set
+        with open(print_prt_path, 'r+b') as file:
+            with mmap.mmap(file.fileno(), 0) as mm:
+                offset = utils._mmap_line_offset(
+                    mm=mm,
+                    nth_line=nth_line
+                )
+                if mm[offset] != flag:
+                    mm[offset] = flag
+                    mm.flush()
 
         return None
 
@@ -442,20 +443,12 @@ class TxtinoutReader:
             vars_values=locals()
         )
 
-        # File path of print.prt
-        print_prt_path = self.root_dir / 'print.prt'
-
-        # Open the file in read mode and read its contents
-        with open(print_prt_path, 'r') as file:
-            lines = file.readlines()
-
-            nth_line = 3
-            columns = lines[nth_line - 1].split()
-            lines[nth_line - 1] = f"{columns[0]:<12}{columns[1]:<11}{columns[2]:<11}{columns[3]:<10}{columns[4]:<10}{interval}\n"
-
-        # Modify print.prt file
-        with open(print_prt_path, 'w') as file:
-            file.writelines(lines)
+        # Modify the targeted line of print.prt file
+        utils._file_line_update(
+            file_path=self._print_prt_file,
+            nth_line=3,
+            line_update=lambda columns: f"{columns[0]:<12}{columns[1]:<11}{columns[2]:<11}{columns[3]:<10}{columns[4]:<10}{interval}"
+        )
 
         return None
 
@@ -500,20 +493,12 @@ class TxtinoutReader:
         end_day = end_dt.timetuple().tm_yday
         end_year = end_dt.year
 
-        # File path of print.prt
-        print_prt_path = self.root_dir / 'print.prt'
-
-        # Open the file in read mode and read its contents
-        with open(print_prt_path, 'r') as file:
-            lines = file.readlines()
-
-            nth_line = 3
-            columns = lines[nth_line - 1].split()
-            lines[nth_line - 1] = f"{columns[0]:<12}{start_day:<11}{start_year:<11}{end_day:<10}{end_year:<10}{columns[5]}\n"
-
-        # Modify print.prt file
-        with open(print_prt_path, 'w') as file:
-            file.writelines(lines)
+        # Modify the targeted line of print.prt file
+        utils._file_line_update(
+            file_path=self._print_prt_file,
+            nth_line=3,
+            line_update=lambda columns: f"{columns[0]:<12}{start_day:<11}{start_year:<11}{end_day:<10}{end_year:<10}{columns[5]}"
+        )
 
         return None
 
@@ -553,18 +538,22 @@ class TxtinoutReader:
             input_dir=sim_dir
         )
 
-        # Ignored files
-        _ignored_files_endswith = tuple(
-            f'_{suffix}.{ext}'
-            for suffix in ('day', 'mon', 'yr', 'aa')
-            for ext in ('txt', 'csv')
-        )
-
-        # Copy files from source folder
-        for src_file in self.root_dir.iterdir():
-            if src_file.is_dir() or src_file.name.endswith(_ignored_files_endswith):
-                continue
-            shutil.copy2(src_file, sim_dir / src_file.name)
+        # Copy files from source folder concurrently to overlap per-file I/O latency
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_COPY_MAX_WORKERS) as executor:
+            # Directory entries cache the file type, avoiding a stat call per file
+            with os.scandir(self.root_dir) as entries:
+                futures = [
+                    executor.submit(
+                        utils._file_copy,
+                        src_file=entry.path,
+                        dst_file=sim_dir / entry.name
+                    )
+                    for entry in entries
+                    if not (entry.is_dir() or _IGNORED_FILES_RE.search(entry.name))
+                ]
+            # Raise any copy error
+            for future in futures:
+                future.result()
 
         return sim_dir
 
@@ -590,22 +579,20 @@ class TxtinoutReader:
         # Number of parameters (number of rows in the DataFrame)
         num_parameters = len(parameters)
 
-        # Column widths for right-alignment
-        col_widths = {
-            'NAME': 12,
-            'CHG_TYPE': 8,
-            'VAL': 16,
-            'CONDS': 16,
-            'LYR1': 8,
-            'LYR2': 8,
-            'YEAR1': 8,
-            'YEAR2': 8,
-            'DAY1': 8,
-            'DAY2': 8,
-            'OBJ_TOT': 8
-        }
+        # Header lines
+        headers = (
+            f"{'NAME':<12}{'CHG_TYPE':<21}{'VAL':<14}{'CONDS':<9}"
+            f"{'LYR1':<8}{'LYR2':<7}{'YEAR1':<8}{'YEAR2':<9}"
+            f"{'DAY1':<8}{'DAY2':<5}{'OBJ_TOT':>7}"
+        )
+        calibration_cal_lines = [
+            f'Number of parameters:\n{num_parameters}\n{headers}\n'
+        ]
 
-        calibration_cal_rows = []
+        # Zero LYR1, LYR2, YEAR1, YEAR2, DAY1, and DAY2 columns, right-aligned to 8 characters each
+        zero_columns = f'{0:>8}' * 6
+
+        # Build each parameter row in a single pass
         for change in parameters:
             units = change.units
 
@@ -615,55 +602,25 @@ class TxtinoutReader:
             # get conditions
             parsed_conditions = utils._dict_conditions_parse(change)
 
-            calibration_cal_rows.append(
-                {
-                    'NAME': change.name,
-                    'CHG_TYPE': change.change_type,
-                    'VAL': change.value,
-                    'CONDS': len(parsed_conditions),
-                    'LYR1': 0,
-                    'LYR2': 0,
-                    'YEAR1': 0,
-                    'YEAR2': 0,
-                    'DAY1': 0,
-                    'DAY2': 0,
-                    'OBJ_TOT': len(compacted_units),
-                    'OBJ_LIST': compacted_units,
-                    'PARSED_CONDITIONS': parsed_conditions
-                }
+            # Left-aligned NAME, special VAL formatting, and right-aligned other columns
+            line = (
+                f'{change.name:<12}{change.change_type:>8}'
+                f'{utils._calibration_val_field_str(change.value)}'
+                f'{len(parsed_conditions):>16}{zero_columns}{len(compacted_units):>8}'
             )
 
+            # Append compacted units at the end (space-separated)
+            if compacted_units:
+                line += '       ' + '    '.join(str(u) for u in compacted_units)
+
+            if parsed_conditions:
+                line += '\n' + '\n'.join(parsed_conditions)
+
+            calibration_cal_lines.append(line + '\n')
+
+        # Write calibration.cal file
         with open(outfile, 'w') as f:
-            # Write header
-            f.write(f'Number of parameters:\n{num_parameters}\n')
-            headers = (
-                f"{'NAME':<12}{'CHG_TYPE':<21}{'VAL':<14}{'CONDS':<9}"
-                f"{'LYR1':<8}{'LYR2':<7}{'YEAR1':<8}{'YEAR2':<9}"
-                f"{'DAY1':<8}{'DAY2':<5}{'OBJ_TOT':>7}"
-            )
-            f.write(f'{headers}\n')
-
-            # Write rows
-            col_names = [c for c in col_widths]
-            for row in calibration_cal_rows:
-                line = ''
-                for col in col_names:
-                    if col == 'NAME':
-                        line += f'{row[col]:<{col_widths[col]}}'   # left-align
-                    elif col == 'VAL' and isinstance(row[col], float):
-                        line += utils._calibration_val_field_str(typing.cast(float, row[col]))  # special VAL formatting
-                    else:
-                        line += f'{row[col]:>{col_widths[col]}}'  # right-align numeric columns
-
-                # Append compacted units at the end (space-separated)
-                if row['OBJ_LIST']:
-                    line += '       ' + '    '.join(str(u) for u in typing.cast(list[str], row['OBJ_LIST']))
-
-                if row['PARSED_CONDITIONS']:
-                    parsed_conditions = typing.cast(list[str], row['PARSED_CONDITIONS'])
-                    line += '\n' + '\n'.join(parsed_conditions)
-
-                f.write(line + '\n')
+            f.write(''.join(calibration_cal_lines))
 
         return None
 
@@ -802,6 +759,7 @@ class TxtinoutReader:
                 'yearly': True,
                 'avann': True
             }
+            obj_flags = {}
             for key, val in print_prt_control.items():
                 if key is None:
                     raise ValueError(
@@ -811,24 +769,26 @@ class TxtinoutReader:
                     raise TypeError(
                         f'Expected a dictionary for key "{key}" in print_prt_control, but got type "{type(val).__name__}"'
                     )
-                elif len(val) == 0:
-                    self.enable_object_in_print_prt(
-                        obj=key,
-                        **default_dict
-                    )
-                else:
-                    key_dict = default_dict.copy()
-                    for sub_key, sub_val in val.items():
-                        if sub_key not in key_dict:
-                            raise KeyError(
-                                f'Invalids sub-key "{sub_key}" for key "{key}" in print_prt_control, '
-                                f'expected sub-keys are [{", ".join(key_dict.keys())}]'
-                            )
-                        key_dict[sub_key] = sub_val
-                    self.enable_object_in_print_prt(
-                        obj=key,
-                        **key_dict
-                    )
+                validators._print_prt_object(
+                    obj=key,
+                    allow_unavailable_object=False
+                )
+                key_dict = default_dict.copy()
+                for sub_key, sub_val in val.items():
+                    if sub_key not in key_dict:
+                        raise KeyError(
+                            f'Invalids sub-key "{sub_key}" for key "{key}" in print_prt_control, '
+                            f'expected sub-keys are [{", ".join(key_dict.keys())}]'
+                        )
+                    if not isinstance(sub_val, bool):
+                        raise TypeError(
+                            f'Expected "{sub_key}" to be "bool", but got type "{type(sub_val).__name__}"'
+                        )
+                    key_dict[sub_key] = sub_val
+                obj_flags[key] = key_dict
+            self._update_print_prt_objects(
+                obj_flags=obj_flags
+            )
 
         if print_begin_date and print_end_date:
             self.set_print_period(
@@ -850,18 +810,30 @@ class TxtinoutReader:
         Run the SWAT+ simulation.
         '''
 
+        # Discard standard output if it would not be logged
+        log_stdout = logger.isEnabledFor(logging.INFO)
+
         try:
-            # Run simulation
+            # Run simulation; paths are already resolved at initialization
             process = subprocess.Popen(
-                [str(self.exe_file.resolve())],
-                cwd=str(self.root_dir.resolve()),
-                stdout=subprocess.PIPE,
+                [self._exe_file_str],
+                cwd=self._root_dir_str,
+                stdout=subprocess.PIPE if log_stdout else subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 bufsize=1,
                 text=True
             )
 
-            # Real-time output handling
+            # Drain error output in a background thread so that a full pipe cannot block the process
+            stderr_lines: list[str] = []
+            stderr_thread = threading.Thread(
+                target=utils._stream_drain,
+                args=(process.stderr, stderr_lines),
+                daemon=True
+            )
+            stderr_thread.start()
+
+            # Real-time output handling; stdout is None when discarded
             if process.stdout:
                 for line in process.stdout:
                     clean_line = line.strip()
@@ -870,12 +842,12 @@ class TxtinoutReader:
 
             # Wait for process and check for errors
             return_code = process.wait()
+            stderr_thread.join()
             if return_code != 0:
-                stderr = process.stderr.read() if process.stderr else None
                 raise subprocess.CalledProcessError(
                     return_code,
                     process.args,
-                    stderr=stderr
+                    stderr=''.join(stderr_lines)
                 )
         # Raise error
         except Exception as e:
@@ -887,7 +859,7 @@ class TxtinoutReader:
     def run_swat(
         self,
         sim_dir: typing.Optional[str | pathlib.Path] = None,
-        parameters: typing.Optional[newtype.ModifyType] = None,
+        parameters: typing.Optional[newtype.ModifyType | list[newtype.ModifyDict]] = None,
         begin_date: typing.Optional[str] = None,
         end_date: typing.Optional[str] = None,
         simulation_timestep: typing.Optional[int] = None,
@@ -915,6 +887,10 @@ class TxtinoutReader:
                 - `conditions` (dict[str, list[str]]): Optional. Conditions to apply when changing the parameter.
                   Supported keys include `'hsg'`, `'texture'`, `'plant'`, and `'landuse'`, each mapped to a list of allowed values.
 
+                A list of `pySWATPlus.newtype.ModifyDict` objects is also accepted. It is checked for duplicates and
+                validated against the input files like dictionaries, but the objects are not converted again.
+                Dictionaries and `ModifyDict` objects cannot be mixed in the same list.
+
                 Examples:
                 ```python
                 parameters = [
@@ -1000,8 +976,9 @@ class TxtinoutReader:
             run_path = self.copy_required_files(
                 sim_dir=sim_dir
             )
-            reader = TxtinoutReader(
-                tio_dir=run_path
+            reader = TxtinoutReader._from_copied_dir(
+                tio_dir=run_path,
+                exe_name=self.exe_file.name
             )
         else:
             reader = self
@@ -1027,18 +1004,14 @@ class TxtinoutReader:
                 parameters=parameters,
             )
 
-            # Check if input calibration parameters exists in cal_parms.cal
-            validators._calibration_parameters(
-                input_dir=reader.root_dir,
-                parameters=params
+            # Validate parameter names, units, and conditions against the source directory;
+            # cached for repeated simulations with the same parameter structure
+            validators._calibration_structure(
+                input_dir=self.root_dir,
+                structure=utils._parameters_structure_key(params),
+                skip_validation=skip_validation
             )
 
-            if not skip_validation:
-                validators._calibration_conditions_and_units(
-                    input_dir=reader.root_dir,
-                    parameters=params
-                )
-
             reader._write_calibration_file(
                 parameters=params
             )
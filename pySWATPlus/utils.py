@@ -5,10 +5,12 @@ import io
 import pathlib
 import typing
 import collections.abc
+import mmap
 from . import newtype
 from . import validators
 import os
 import sys
+import shutil
 
 
 def _print_prt_line_add(
@@ -37,6 +39,98 @@ def _print_prt_line_add(
     return arg_to_add.rstrip() + '\n'
 
 
+def _mmap_line_offset(
+    mm: mmap.mmap,
+    nth_line: int
+) -> int:
+    '''
+    Return the byte offset of the start of the 1-based `nth_line` in a memory-mapped file.
+    '''
+
+    offset = 0
+    for i in range(1, nth_line):
+        offset = mm.find(b'\n', offset) + 1
+        if offset == 0 or offset == len(mm):
+            raise IndexError(
+                f'The file only has {i} lines, cannot access line {nth_line}'
+            )
+
+    return offset
+
+
+def _file_line_update(
+    file_path: str | pathlib.Path,
+    nth_line: int,
+    line_update: collections.abc.Callable[[list[str]], str]
+) -> None:
+    '''
+    Update the 1-based `nth_line` of a file, where `line_update` builds the new line (without line ending)
+    from the whitespace-separated columns of the existing line. The line is overwritten in place through
+    a memory map when its length is unchanged; otherwise the file is rewritten. Line endings are preserved.
+    '''
+
+    with open(file_path, 'r+b') as file:
+        with mmap.mmap(file.fileno(), 0) as mm:
+            # Byte range of the line content, excluding the line ending
+            start = _mmap_line_offset(
+                mm=mm,
+                nth_line=nth_line
+            )
+            end = mm.find(b'\n', start)
+            end = len(mm) if end == -1 else end
+            if end > start and mm[end - 1] == ord('\r'):
+                end = end - 1
+
+            # New line content
+            new_line = line_update(mm[start:end].decode().split()).encode()
+
+            # Overwrite in place if the length is unchanged
+            if len(new_line) == end - start:
+                mm[start:end] = new_line
+                mm.flush()
+                return None
+
+            data = mm[:start] + new_line + mm[end:]
+
+    # Rewrite the file if the length is changed
+    _file_write_bytes(
+        file_path=file_path,
+        data=data
+    )
+
+    return None
+
+
+def _file_write_bytes(
+    file_path: str | pathlib.Path,
+    data: bytes
+) -> None:
+    '''
+    Replace the contents of a file with `data` using a single `os.write` call, bypassing the
+    buffered I/O layers. Data is written to a temporary file in the same directory, which then
+    atomically replaces the original file so that a failure never leaves it partially written.
+    '''
+
+    tmp_path = f'{file_path}.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        # Keep permission bits of the original file
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return None
+
+
 def _date_str_to_object(
     date_str: str
 ) -> datetime.date:
@@ -298,38 +392,73 @@ def _sensitivity_output_retrieval(
 
 
 def _parameters_modify_dict_list(
-    parameters: list[dict[str, typing.Any]],
+    parameters: list[dict[str, typing.Any]] | list[newtype.ModifyDict],
 ) -> list[newtype.ModifyDict]:
     '''
     Convert each dictionary in the `parameters` list into a `pySWATPlus.newtype.ModifyDict` object.
+    A list of `pySWATPlus.newtype.ModifyDict` objects is checked for duplicates and returned without conversion.
     '''
 
+    # Number of ModifyDict objects in the list
+    modify_count = sum(
+        isinstance(param, newtype.ModifyDict) for param in parameters
+    )
+
+    # ModifyDict objects, already validated by the model
+    if parameters and modify_count == len(parameters):
+        modify_list = typing.cast(list[newtype.ModifyDict], parameters)
+        validators._parameters_contain_unique_dict(
+            parameters=[param.model_dump() for param in modify_list]
+        )
+        return modify_list
+
+    # Mixed list of ModifyDict objects and dictionaries
+    if modify_count > 0:
+        raise TypeError(
+            'Items in "parameters" list must be either all dictionaries or all ModifyDict objects, not a mix of both'
+        )
+
+    dict_list = typing.cast(list[dict[str, typing.Any]], parameters)
+
     # Validate the "parameters" list contains unique dictionaries
     validators._parameters_contain_unique_dict(
-        parameters=parameters
+        parameters=dict_list
     )
 
-    valid_keys = [
-        'name',
-        'value',
-        'change_type',
-        'units',
-        'conditions'
-    ]
+    # Validate keys of dictionaries
+    validators._parameters_valid_keys(
+        parameters=dict_list,
+        valid_keys=['name', 'value', 'change_type', 'units', 'conditions']
+    )
 
-    param_list = []
-    for param in parameters:
-        for key in param:
-            if key not in valid_keys:
-                raise KeyError(
-                    f'Invalid key "{key}" for {json.dumps(param)} in "parameters"; '
-                    f'expected keys are {json.dumps(valid_keys)}'
-                )
-        param_list.append(newtype.ModifyDict(**param))
+    param_list = [
+        newtype.ModifyDict(**param) for param in dict_list
+    ]
 
     return param_list
 
 
+def _parameters_structure_key(
+    parameters: collections.abc.Sequence[newtype.BaseDict]
+) -> tuple[tuple[typing.Any, ...], ...]:
+    '''
+    Generate a hashable key of the parameter structure (name, change type, units, and conditions),
+    excluding numeric values, to cache validation of repeated simulations.
+    '''
+
+    structure = tuple(
+        (
+            param.name,
+            param.change_type,
+            tuple(param.units) if param.units is not None else None,
+            tuple((k, tuple(v)) for k, v in param.conditions.items()) if param.conditions is not None else None
+        )
+        for param in parameters
+    )
+
+    return structure
+
+
 def _parameters_bound_dict_list(
     parameters: list[dict[str, typing.Any]],
 ) -> list[newtype.BoundDict]:
@@ -342,24 +471,15 @@ def _parameters_bound_dict_list(
         parameters=parameters
     )
 
-    valid_keys = [
-        'name',
-        'change_type',
-        'lower_bound',
-        'upper_bound',
-        'units',
-        'conditions'
-    ]
+    # Validate keys of dictionaries
+    validators._parameters_valid_keys(
+        parameters=parameters,
+        valid_keys=['name', 'change_type', 'lower_bound', 'upper_bound', 'units', 'conditions']
+    )
 
-    param_list = []
-    for param in parameters:
-        for key in param:
-            if key not in valid_keys:
-                raise KeyError(
-                    f'Invalid key "{key}" for {json.dumps(param)} in "parameters"; '
-                    f'expected keys are {json.dumps(valid_keys)}'
-                )
-        param_list.append(newtype.BoundDict(**param))
+    param_list = [
+        newtype.BoundDict(**param) for param in parameters
+    ]
 
     return param_list
 
@@ -465,3 +585,56 @@ def _is_real_executable(file_path: pathlib.Path) -> bool:
 def _find_executables(folder: pathlib.Path) -> list[pathlib.Path]:
     """Find all executable files in a given folder."""
     return [f for f in folder.iterdir() if _is_real_executable(f)]
+
+
+def _file_copy(
+    src_file: str | pathlib.Path,
+    dst_file: str | pathlib.Path
+) -> None:
+    '''
+    Copy a file with its metadata, equivalent to `shutil.copy2`. Where available, data is copied
+    within the kernel by `os.copy_file_range`, which reflinks on copy-on-write file systems;
+    otherwise `shutil.copyfile` is used.
+    '''
+
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src_file, 'rb') as fsrc, open(dst_file, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        # Nothing copied by the kernel on some file systems, or source truncated
+                        break
+                    remaining -= sent
+            copied = remaining == 0
+        except OSError:
+            # Unsupported by the kernel or across file systems
+            pass
+
+    # Fall back on unsupported or incomplete kernel copy
+    if not copied:
+        shutil.copyfile(src_file, dst_file)
+
+    # Preserve metadata
+    shutil.copystat(src_file, dst_file)
+
+    return None
+
+
+def _stream_drain(
+    stream: typing.Optional[typing.IO[str]],
+    lines: list[str]
+) -> None:
+    '''
+    Read a text stream line by line until it is exhausted, appending each line to `lines`.
+    '''
+
+    if stream is None:
+        return None
+
+    for line in stream:
+        lines.append(line)
+
+    return None
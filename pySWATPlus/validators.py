@@ -4,6 +4,8 @@ import typing
 import types
 import datetime
 import json
+import functools
+import collections.abc
 from . import newtype
 
 
@@ -120,6 +122,41 @@ def _date_within_range(
     return None
 
 
+def _print_prt_object(
+    obj: str,
+    allow_unavailable_object: bool
+) -> None:
+    '''
+    Check that the object is available in the standard SWAT+ output object list of the `print.prt` file.
+    '''
+
+    # Dictionary of available objects
+    obj_dict = {
+        'model_components': ['channel', 'channel_sd', 'channel_sdmorph', 'aquifer', 'reservoir', 'recall', 'ru', 'hyd', 'water_allo'],
+        'basin_model_components': ['basin_cha', 'basin_sd_cha', 'basin_sd_chamorph', 'basin_aqu', 'basin_res', 'basin_psc'],
+        'region_model_components': ['region_sd_cha', 'region_aqu', 'region_res', 'region_psc'],
+        'nutrient_balance': ['basin_nb', 'lsunit_nb', 'hru_nb', 'hru-lte_nb', 'region_nb'],
+        'water_balance': ['basin_wb', 'lsunit_wb', 'hru_wb', 'hru-lte_wb', 'region_wb'],
+        'plant_weather': ['basin_pw', 'lsunit_pw', 'hru_pw', 'hru-lte_pw', 'region_pw'],
+        'losses': ['basin_ls', 'lsunit_ls', 'hru_ls', 'hru-lte_ls', 'region_ls'],
+        'salts': ['basin_salt', 'hru_salt', 'ru_salt', 'aqu_salt', 'channel_salt', 'res_salt', 'wetland_salt'],
+        'constituents': ['basin_cs', 'hru_cs', 'ru_cs', 'aqu_cs', 'channel_cs', 'res_cs', 'wetland_cs']
+    }
+
+    # List of objects obtained from the dictionary
+    obj_list = [
+        i for v in obj_dict.values() for i in v
+    ]
+
+    # Check 'obj' is valid
+    if obj not in obj_list and not allow_unavailable_object:
+        raise ValueError(
+            f'Object "{obj}" not found in print.prt file; use "allow_unavailable_object=True" to proceed'
+        )
+
+    return None
+
+
 def _parameters_contain_unique_dict(
     parameters: list[dict[str, typing.Any]]
 ) -> None:
@@ -141,9 +178,31 @@ def _parameters_contain_unique_dict(
     return None
 
 
+def _parameters_valid_keys(
+    parameters: list[dict[str, typing.Any]],
+    valid_keys: list[str]
+) -> None:
+    '''
+    Check that every dictionary in the input calibration list contains only valid keys.
+    '''
+
+    # Set lookup shared by all dictionaries
+    valid_set = frozenset(valid_keys)
+
+    for param in parameters:
+        if not valid_set.issuperset(param):
+            key = next(k for k in param if k not in valid_set)
+            raise KeyError(
+                f'Invalid key "{key}" for {json.dumps(param)} in "parameters"; '
+                f'expected keys are {json.dumps(valid_keys)}'
+            )
+
+    return None
+
+
 def _calibration_units(
     input_dir: pathlib.Path,
-    param_change: newtype.ModifyDict
+    param_change: newtype.BaseDict
 ) -> None:
     '''
     Validate units for a given parameter change against calibration parameters.
@@ -203,7 +262,7 @@ def _calibration_units(
 
 def _calibration_conditions(
     input_dir: pathlib.Path,
-    param_change: newtype.ModifyDict
+    param_change: newtype.BaseDict
 ) -> None:
     '''
     Validate conditions for a given parameter change against calibration parameters.
@@ -252,7 +311,7 @@ def _calibration_conditions(
 
 def _calibration_conditions_and_units(
     input_dir: pathlib.Path,
-    parameters: list[newtype.ModifyDict]
+    parameters: collections.abc.Sequence[newtype.BaseDict]
 ) -> None:
     '''
     Check the following:
@@ -283,7 +342,7 @@ def _calibration_conditions_and_units(
 
 def _calibration_parameters(
     input_dir: pathlib.Path,
-    parameters: list[newtype.BoundDict] | list[newtype.ModifyDict]
+    parameters: collections.abc.Sequence[newtype.BaseDict]
 ) -> None:
     '''
     Validate existence of input calibration parameters in `cal_parms.cal`.
@@ -309,6 +368,86 @@ def _calibration_parameters(
     return None
 
 
+# Input files read by the calibration parameter, units, and conditions validation
+_CALIBRATION_VALIDATION_FILES = (
+    'cal_parms.cal',
+    'hru-data.hru',
+    'reservoir.res',
+    'aquifer.aqu',
+    'soils.sol',
+    'plants.plt',
+    'landuse.lum'
+)
+
+
+def _calibration_structure(
+    input_dir: pathlib.Path,
+    structure: tuple[tuple[typing.Any, ...], ...],
+    skip_validation: bool
+) -> None:
+    '''
+    Validate parameter names, and units and conditions unless `skip_validation` is `True`, for the
+    parameter structure generated by `pySWATPlus.utils._parameters_structure_key`. Results are cached,
+    so repeated simulations with the same structure and differing values are validated only once,
+    until any of the input files read by the validation is modified.
+    '''
+
+    # Modification time and size of the input files read by the validation
+    file_stamps: list[typing.Optional[tuple[int, int]]] = []
+    for file_name in _CALIBRATION_VALIDATION_FILES:
+        try:
+            file_stat = (input_dir / file_name).stat()
+            file_stamps.append((file_stat.st_mtime_ns, file_stat.st_size))
+        except FileNotFoundError:
+            file_stamps.append(None)
+
+    _calibration_structure_cached(
+        input_dir=input_dir,
+        structure=structure,
+        skip_validation=skip_validation,
+        file_stamps=tuple(file_stamps)
+    )
+
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _calibration_structure_cached(
+    input_dir: pathlib.Path,
+    structure: tuple[tuple[typing.Any, ...], ...],
+    skip_validation: bool,
+    file_stamps: tuple[typing.Optional[tuple[int, int]], ...]
+) -> None:
+    '''
+    Cached validation for `_calibration_structure`; `file_stamps` is part of the cache key only.
+    '''
+
+    # List of BaseDict objects rebuilt from the structure
+    parameters = [
+        newtype.BaseDict(
+            name=name,
+            change_type=change_type,
+            units=list(units) if units is not None else None,
+            conditions={k: list(v) for k, v in conditions} if conditions is not None else None
+        )
+        for name, change_type, units, conditions in structure
+    ]
+
+    # Check if input calibration parameters exists in cal_parms.cal
+    _calibration_parameters(
+        input_dir=input_dir,
+        parameters=parameters
+    )
+
+    if not skip_validation:
+        _calibration_conditions_and_units(
+            input_dir=input_dir,
+            parameters=parameters
+        )
+
+    return None
+
+
 def _json_extension(
     json_file: pathlib.Path
 ) -> None:
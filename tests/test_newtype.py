@@ -55,3 +55,34 @@ def test_error_parameters():
             ]
         )
     assert 'Invalid key "lower_boundd"' in exc_info.value.args[0]
+
+
+def test_modify_dict_list_passthrough():
+
+    # Pass: validated ModifyDict objects are used as-is
+    parameters = [
+        pySWATPlus.newtype.ModifyDict(name='cn2', change_type='pctchg', value=10)
+    ]
+    output = pySWATPlus.utils._parameters_modify_dict_list(
+        parameters=parameters
+    )
+    assert output is parameters
+
+    # Error: duplicate ModifyDict objects
+    modify_dict = pySWATPlus.newtype.ModifyDict(name='cn2', change_type='pctchg', value=10)
+    with pytest.raises(Exception) as exc_info:
+        pySWATPlus.utils._parameters_modify_dict_list(
+            parameters=[modify_dict, modify_dict]
+        )
+    assert exc_info.value.args[0] == 'Duplicate dictionary found in "parameters" list'
+
+    # Error: mixed list of ModifyDict objects and dictionaries
+    with pytest.raises(Exception) as exc_info:
+        pySWATPlus.utils._parameters_modify_dict_list(
+            parameters=[
+                modify_dict,
+                {'name': 'esco', 'change_type': 'absval', 'value': 0.5}
+            ]
+        )
+    assert isinstance(exc_info.value, TypeError)
+    assert 'not a mix of both' in exc_info.value.args[0]
@@ -1,4 +1,8 @@
 import os
+import sys
+import logging
+import subprocess
+import threading
 import pySWATPlus
 import pytest
 import tempfile
@@ -47,6 +51,11 @@ def test_run_swat(
             target_line = read_output.readlines()[6]
         assert target_line[0] == 'y'
 
+        # Pass: enable CSV print again without modifying the file
+        mtime_ns = os.stat(printprt_file).st_mtime_ns
+        sim_reader.enable_csv_print()
+        assert os.stat(printprt_file).st_mtime_ns == mtime_ns
+
         # Pass: update all objects in print.prt
         sim_reader.enable_object_in_print_prt(
             obj=None,
@@ -161,6 +170,133 @@ def test_run_swat(
             assert target_line[0] == 'n'
 
 
+def test_run_swat_modify_dict(
+    txtinout_reader
+):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        # Pass: run SWAT+ with a list of ModifyDict objects
+        sim_dir = txtinout_reader.run_swat(
+            sim_dir=tmp_dir,
+            parameters=[
+                pySWATPlus.newtype.ModifyDict(name='cn2', change_type='pctchg', value=10),
+                pySWATPlus.newtype.ModifyDict(name='esco', change_type='absval', value=0.5, units=[1, 2, 3])
+            ],
+            begin_date='01-Jan-2010',
+            end_date='31-Dec-2010'
+        )
+
+        # Pass: calibration.cal contains both parameters
+        with open(sim_dir / 'calibration.cal', 'r') as f:
+            lines = f.readlines()
+        assert lines[1].strip() == '2'
+        assert lines[3].split()[:3] == ['cn2', 'pctchg', '10.0']
+        assert lines[4].split()[:3] == ['esco', 'absval', '0.5']
+
+        # Pass: calibration.cal is enabled in file.cio
+        with open(sim_dir / 'file.cio', 'r') as f:
+            assert 'calibration.cal' in f.read()
+
+
+def test_from_copied_dir(
+    txtinout_reader
+):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sim_dir = txtinout_reader.copy_required_files(
+            sim_dir=tmp_dir
+        )
+
+        # Pass: same paths as a validated TxtinoutReader instance
+        sim_reader = pySWATPlus.TxtinoutReader._from_copied_dir(
+            tio_dir=sim_dir,
+            exe_name=txtinout_reader.exe_file.name
+        )
+        valid_reader = pySWATPlus.TxtinoutReader(
+            tio_dir=sim_dir
+        )
+        assert sim_reader.root_dir == valid_reader.root_dir
+        assert sim_reader.exe_file == valid_reader.exe_file
+
+
+def test_error_copy_required_files(
+    txtinout_reader,
+    monkeypatch
+):
+
+    file_copy = pySWATPlus.utils._file_copy
+
+    def failing_file_copy(src_file, dst_file):
+        if os.path.basename(src_file) == 'time.sim':
+            raise PermissionError(f'Permission denied: {src_file}')
+        file_copy(src_file, dst_file)
+
+    monkeypatch.setattr(pySWATPlus.utils, '_file_copy', failing_file_copy)
+
+    # Error: failed copy of a single file is raised
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with pytest.raises(Exception) as exc_info:
+            txtinout_reader.copy_required_files(
+                sim_dir=tmp_dir
+            )
+        assert isinstance(exc_info.value, PermissionError)
+        assert 'time.sim' in exc_info.value.args[0]
+
+
+@pytest.mark.skipif(
+    os.name != 'posix',
+    reason='requires an executable script with a shebang line'
+)
+def test_error_run_swat_exe_large_stderr(
+    caplog
+):
+
+    # Standard output is piped and logged while more than 64 KiB of error output is written
+    caplog.set_level(logging.INFO, logger='pySWATPlus.txtinout_reader')
+    stderr_text = 'swat error\n' * 20000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exe_file = pathlib.Path(tmp_dir) / 'swat_exe'
+        exe_file.write_text(
+            f'#!{sys.executable}\n'
+            'import sys\n'
+            'sys.stdout.write("Execution started\\n")\n'
+            f'sys.stderr.write({stderr_text!r})\n'
+            'sys.stdout.write("Execution failed\\n")\n'
+            'sys.exit(1)\n'
+        )
+        exe_file.chmod(0o755)
+        reader = pySWATPlus.TxtinoutReader._from_copied_dir(
+            tio_dir=pathlib.Path(tmp_dir),
+            exe_name=exe_file.name
+        )
+
+        # Run in a thread so that a blocked pipe fails the test instead of hanging
+        errors: list[Exception] = []
+
+        def run_exe():
+            try:
+                reader._run_swat_exe()
+            except Exception as e:
+                errors.append(e)
+
+        run_thread = threading.Thread(
+            target=run_exe,
+            daemon=True
+        )
+        run_thread.start()
+        run_thread.join(timeout=60)
+
+        # Error: non-zero exit with full error output
+        assert not run_thread.is_alive()
+        assert len(errors) == 1
+        assert isinstance(errors[0], subprocess.CalledProcessError)
+        assert errors[0].returncode == 1
+        assert errors[0].stderr == stderr_text
+        assert 'Execution failed' in caplog.text
+
+
 def test_error_txtinoutreader_class():
 
     # Error: invalid input path type
@@ -468,6 +604,20 @@ def test_error_run_swat(
         )
     assert 'Invalids sub-key "dailyy" for key "basin_wb" in print_prt_control' in exc_info.value.args[0]
 
+    # Error: invalid sub key value type in print_prt_control
+    with pytest.raises(Exception) as exc_info:
+        txtinout_reader.run_swat(
+            print_prt_control={'basin_wb': {'daily': 1}}
+        )
+    assert exc_info.value.args[0] == 'Expected "daily" to be "bool", but got type "int"'
+
+    # Error: invalid object in print_prt_control
+    with pytest.raises(Exception) as exc_info:
+        txtinout_reader.run_swat(
+            print_prt_control={'invalid_obj': {}}
+        )
+    assert exc_info.value.args[0] == 'Object "invalid_obj" not found in print.prt file; use "allow_unavailable_object=True" to proceed'
+
     # Error: duplicate dictionary in list of parameters to be modified
     with pytest.raises(Exception) as exc_info:
         txtinout_reader.run_swat(
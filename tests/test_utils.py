@@ -1,3 +1,7 @@
+import os
+import mmap
+import tempfile
+import pathlib
 import pySWATPlus
 import pytest
 
@@ -75,3 +79,118 @@ def test_dict_units_compact():
 
     # --- single non-consecutive elements ---
     assert pySWATPlus.utils._dict_units_compact([1, 2, 4, 6]) == [1, -2, 4, 6]
+
+
+def test_mmap_line_offset():
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'lines.txt')
+        with open(file_path, 'wb') as f:
+            f.write(b'first\nsecond\r\nthird\n')
+
+        with open(file_path, 'r+b') as f:
+            with mmap.mmap(f.fileno(), 0) as mm:
+                # --- first line ---
+                assert pySWATPlus.utils._mmap_line_offset(mm, 1) == 0
+
+                # --- line after LF and CRLF endings ---
+                assert pySWATPlus.utils._mmap_line_offset(mm, 2) == 6
+                assert pySWATPlus.utils._mmap_line_offset(mm, 3) == 14
+
+                # --- line beyond end of file ---
+                with pytest.raises(Exception) as exc_info:
+                    pySWATPlus.utils._mmap_line_offset(mm, 4)
+                assert exc_info.value.args[0] == 'The file only has 3 lines, cannot access line 4'
+
+
+def test_file_copy():
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src_file = pathlib.Path(tmp_dir) / 'src.txt'
+        dst_file = pathlib.Path(tmp_dir) / 'dst.txt'
+        src_file.write_bytes(b'swat\n' * 100000)
+        os.utime(src_file, (1000000000, 1000000000))
+
+        pySWATPlus.utils._file_copy(
+            src_file=src_file,
+            dst_file=dst_file
+        )
+
+        # --- same content and modification time ---
+        assert dst_file.read_bytes() == src_file.read_bytes()
+        assert dst_file.stat().st_mtime == src_file.stat().st_mtime
+
+
+def test_file_copy_incomplete(
+    monkeypatch
+):
+
+    # Kernel copy returning 0 bytes must not leave a partial file
+    monkeypatch.setattr(
+        os,
+        'copy_file_range',
+        lambda *args, **kwargs: 0,
+        raising=False
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src_file = pathlib.Path(tmp_dir) / 'src.txt'
+        dst_file = pathlib.Path(tmp_dir) / 'dst.txt'
+        src_file.write_bytes(b'swat\n' * 1000)
+
+        pySWATPlus.utils._file_copy(
+            src_file=src_file,
+            dst_file=dst_file
+        )
+
+        assert dst_file.read_bytes() == src_file.read_bytes()
+
+
+def test_file_line_update():
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = pathlib.Path(tmp_dir) / 'lines.txt'
+        file_path.write_bytes(b'header\r\n  10  20\r\nfooter\r\n')
+
+        # --- same length, overwritten in place ---
+        pySWATPlus.utils._file_line_update(
+            file_path=file_path,
+            nth_line=2,
+            line_update=lambda cols: f'{cols[1]:>4}{cols[0]:>4}'
+        )
+        assert file_path.read_bytes() == b'header\r\n  20  10\r\nfooter\r\n'
+
+        # --- changed length, file rewritten ---
+        pySWATPlus.utils._file_line_update(
+            file_path=file_path,
+            nth_line=2,
+            line_update=lambda cols: ' '.join(cols + ['30'])
+        )
+        assert file_path.read_bytes() == b'header\r\n20 10 30\r\nfooter\r\n'
+
+        # --- last line, shorter than before ---
+        pySWATPlus.utils._file_line_update(
+            file_path=file_path,
+            nth_line=3,
+            line_update=lambda cols: 'end'
+        )
+        assert file_path.read_bytes() == b'header\r\n20 10 30\r\nend\r\n'
+
+
+def test_file_write_bytes():
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = pathlib.Path(tmp_dir) / 'data.txt'
+        file_path.write_bytes(b'old content that is longer\n')
+        file_path.chmod(0o600)
+
+        pySWATPlus.utils._file_write_bytes(
+            file_path=file_path,
+            data=b'new\r\ncontent\n'
+        )
+
+        # --- replaced content, permissions kept, no temporary file left ---
+        assert file_path.read_bytes() == b'new\r\ncontent\n'
+        assert os.listdir(tmp_dir) == ['data.txt']
+        if os.name == 'posix':
+            assert file_path.stat().st_mode & 0o777 == 0o600
@@ -2,6 +2,7 @@ import pySWATPlus
 import pytest
 import os
 import pandas
+import tempfile
 
 
 @pytest.fixture(scope='class')
@@ -184,3 +185,66 @@ def test_calibration_conditions(
             param_change=param_change
         )
     assert 'has invalid value' in exc_info.value.args[0]
+
+
+def test_calibration_structure(
+    txtinout_reader
+):
+
+    pySWATPlus.validators._calibration_structure_cached.cache_clear()
+
+    # Pass: same structure with different values is validated once
+    for value in [0.1, 0.2]:
+        parameters = [
+            pySWATPlus.newtype.ModifyDict(name='perco', change_type='absval', value=value, conditions={'hsg': ['A']}),
+            pySWATPlus.newtype.ModifyDict(name='bf_max', change_type='absval', value=value, units=[1, 2, 3])
+        ]
+        pySWATPlus.validators._calibration_structure(
+            input_dir=txtinout_reader.root_dir,
+            structure=pySWATPlus.utils._parameters_structure_key(parameters),
+            skip_validation=False
+        )
+    cache_info = pySWATPlus.validators._calibration_structure_cached.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+    # Error: invalid condition value is not cached
+    parameters = [
+        pySWATPlus.newtype.ModifyDict(name='perco', change_type='absval', value=0.1, conditions={'hsg': ['E']})
+    ]
+    for _ in range(2):
+        with pytest.raises(ValueError, match='invalid value "E"'):
+            pySWATPlus.validators._calibration_structure(
+                input_dir=txtinout_reader.root_dir,
+                structure=pySWATPlus.utils._parameters_structure_key(parameters),
+                skip_validation=False
+            )
+
+    # Error: cached validation is repeated after an input file is modified
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sim_dir = txtinout_reader.copy_required_files(
+            sim_dir=tmp_dir
+        )
+        parameters = [
+            pySWATPlus.newtype.ModifyDict(name='cn2', change_type='pctchg', value=10, units=[3])
+        ]
+        structure = pySWATPlus.utils._parameters_structure_key(parameters)
+        pySWATPlus.validators._calibration_structure(
+            input_dir=sim_dir,
+            structure=structure,
+            skip_validation=False
+        )
+
+        # Keep title, header, and first 2 HRU rows
+        hru_file = sim_dir / 'hru-data.hru'
+        with open(hru_file, 'r') as f:
+            hru_lines = f.readlines()[:4]
+        with open(hru_file, 'w') as f:
+            f.writelines(hru_lines)
+
+        with pytest.raises(ValueError, match='requested up to 3, available 2'):
+            pySWATPlus.validators._calibration_structure(
+                input_dir=sim_dir,
+                structure=structure,
+                skip_validation=False
+            )